@@ -1,21 +1,34 @@
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import List, Optional, Dict, Any, Callable, Awaitable
+from contextlib import asynccontextmanager, suppress
+from collections import OrderedDict
 import asyncio
 import aiohttp
-import json
+import aiosqlite
+import orjson
 import yaml
 import re
 import time
 import logging
 from datetime import datetime
 import sqlite3
-import os
 from urllib.parse import urljoin, urlparse, quote
 from bs4 import BeautifulSoup
 import hashlib
+import zlib
+import functools
+import base64
+import uuid
+
+# Prefer the LibYAML-backed loader; PyYAML builds without libyaml only ship the pure-Python one
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as YAMLLoader
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,10 +36,76 @@ logger = logging.getLogger(__name__)
 
 # Database setup
 DATABASE_PATH = "mcp_playground.db"
+CACHE_SWEEP_INTERVAL = 300  # seconds between expired search cache purges
+CACHE_COMPRESSION_LEVEL = 3  # zlib level for cached search result payloads
+CACHE_WRITE_BATCH_SIZE = 100  # most search cache rows written in one transaction
+CACHE_WRITE_MAX_DELAY = 0.2  # seconds a queued search cache row waits for others to batch with
+SCHEMA_COMPRESSION_LEVEL = 6  # zlib level for stored MCP schemas, written once and read many times
+HEALTH_CACHE_TTL = 1.0  # seconds a /health response body is reused
+DB_POOL_SIZE = 4  # shared connections; WAL lets their reads run in parallel
+SEARCH_CACHE_TTL = 3600  # seconds search results stay cached, matching search_cache.expires_at
+SAMPLE_DATA_VERSION = 1  # bump whenever SAMPLE_MCPS changes so existing databases are reseeded
+MCP_LIST_CACHE_TTL = 60  # seconds a rendered /mcps page is reused, matching its Cache-Control max-age
+
+# Applied to every pooled request-handling connection
+DB_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",  # ~20 MB page cache per connection, kept warm across requests
+    "PRAGMA mmap_size=268435456"  # serve reads of up to 256 MB of the file straight from the OS page cache
+)
+
+# Canonical statements, kept as constants so sqlite3's statement cache reuses them
+INSERT_MCP_SQL = '''
+    INSERT OR REPLACE INTO mcps (id, name, description, schema_content, tags, domain, validated, popularity, source_url, source_platform, confidence_score, file_type, repository, stars)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+DELETE_MCP_TAGS_SQL = "DELETE FROM mcp_tags WHERE mcp_id = ?"
+INSERT_MCP_TAG_SQL = "INSERT OR IGNORE INTO mcp_tags (mcp_id, tag) VALUES (?, ?)"
+SEARCH_CACHE_LOOKUP_SQL = (
+    "SELECT results, strftime('%s', expires_at) - strftime('%s', 'now') FROM search_cache "
+    "WHERE query = ? AND expires_at > datetime('now')"
+)
+SEARCH_CACHE_INSERT_SQL = "INSERT INTO search_cache (id, query, results, created_at, expires_at) VALUES (?, ?, ?, datetime('now'), datetime('now', '+1 hour'))"
+LOCAL_SEARCH_SQL = '''
+    SELECT mcps.name, mcps.description, mcps.source_url, mcps.tags, mcps.domain, mcps.validated,
+           mcps.schema_content, mcps.file_type, mcps.repository, mcps.stars, mcps.source_platform,
+           mcps.confidence_score
+    FROM mcps_fts JOIN mcps ON mcps.rowid = mcps_fts.rowid
+    WHERE mcps_fts MATCH ?
+    ORDER BY bm25(mcps_fts)
+    LIMIT ?
+'''
+PURGE_EXPIRED_CACHE_SQL = "DELETE FROM search_cache WHERE expires_at < datetime('now')"
+
+# Columns /mcps returns; schema_content is left out since listings never send it
+MCP_LIST_COLUMNS = (
+    "id, name, description, tags, domain, validated, popularity, source_url, "
+    "source_platform, confidence_score, file_type, repository, stars, created_at"
+)
+
+# Supported /mcps sort keys: (column, its position in MCP_LIST_COLUMNS, descending)
+MCP_SORT_KEYS = {
+    "name": ("name", 1, False),
+    "created_at": ("created_at", 13, True),
+    "confidence_score": ("confidence_score", 9, True),
+    "popularity": ("popularity", 6, True)
+}
+
+def connect_setup_db(page_size: Optional[int] = None) -> sqlite3.Connection:
+    """Open a short-lived connection for startup schema and seed work, tuned like the pool"""
+    conn = sqlite3.connect(DATABASE_PATH)
+    if page_size:
+        # Must precede the switch to WAL, and only takes effect when the file is first created
+        conn.execute(f"PRAGMA page_size={page_size}")
+    for pragma in DB_PRAGMAS:
+        conn.execute(pragma)
+    return conn
 
 def init_db():
     """Initialize SQLite database"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = connect_setup_db(page_size=8192)
     cursor = conn.cursor()
     
     # MCPs table
@@ -50,6 +129,39 @@ def init_db():
         )
     ''')
     
+    # Cover the /mcps filter and sort combinations so listings are index range scans
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mcps_domain_pop ON mcps(domain, popularity DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mcps_validated_pop ON mcps(validated, popularity DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mcps_pop ON mcps(popularity DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mcps_conf ON mcps(confidence_score DESC)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mcps_created ON mcps(created_at DESC)")
+    
+    # One row per MCP tag so tag filters are an index probe
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS mcp_tags (
+            mcp_id TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            PRIMARY KEY (mcp_id, tag)
+        )
+    ''')
+    # Covers the tag filter subquery, so matching ids come straight from the index
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mcp_tags_tag_mcp ON mcp_tags(tag, mcp_id)")
+    
+    # Backfill tags for MCPs stored before mcp_tags existed
+    cursor.execute('''
+        INSERT OR IGNORE INTO mcp_tags (mcp_id, tag)
+        SELECT mcps.id, json_each.value FROM mcps, json_each(mcps.tags)
+        WHERE json_valid(mcps.tags) AND NOT EXISTS (SELECT 1 FROM mcp_tags)
+    ''')
+    
+    # Full-text index over the local library, rebuilt whenever MCPs are seeded
+    cursor.execute('''
+        CREATE VIRTUAL TABLE IF NOT EXISTS mcps_fts USING fts5(
+            name, description, tags,
+            content='mcps', content_rowid='rowid'
+        )
+    ''')
+    
     # Web search cache
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS search_cache (
@@ -61,14 +173,161 @@ def init_db():
         )
     ''')
     
+    # Lets the expiry sweep delete stale entries with a range scan
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_search_cache_expires ON search_cache(expires_at)"
+    )
+    
+    # Serves SEARCH_CACHE_LOOKUP_SQL without touching expired rows
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_search_cache_query ON search_cache(query, expires_at)"
+    )
+    
+    # Refresh planner statistics so the indexes above get picked
+    cursor.execute("ANALYZE")
+    
     conn.commit()
     conn.close()
 
+def decompress_json_column(payload) -> bytes:
+    """Return the JSON stored in a zlib-compressed column (search_cache.results, mcps.schema_content)"""
+    # Rows written before compression was introduced hold plain JSON text
+    if isinstance(payload, str):
+        return payload.encode()
+    return zlib.decompress(payload)
+
+async def open_db() -> aiosqlite.Connection:
+    """Open one of the pooled database connections used by request handlers"""
+    # Room for every module-level statement plus the /mcps filter combinations
+    db = await aiosqlite.connect(DATABASE_PATH, isolation_level=None, cached_statements=256)
+    for pragma in DB_PRAGMAS:
+        await db.execute(pragma)
+    return db
+
+class ConnectionPool:
+    """Fixed set of aiosqlite connections, each lent to one caller at a time"""
+    
+    def __init__(self, size: int):
+        self.size = size
+        self._idle: asyncio.Queue = asyncio.Queue()
+    
+    async def open(self):
+        for _ in range(self.size):
+            self._idle.put_nowait(await open_db())
+    
+    @asynccontextmanager
+    async def acquire(self):
+        db = await self._idle.get()
+        try:
+            yield db
+        finally:
+            self._idle.put_nowait(db)
+    
+    async def close(self):
+        # Wait for checked-out connections to come back so every one gets closed
+        for _ in range(self.size):
+            db = await self._idle.get()
+            await db.close()
+
+async def purge_expired_cache(db: aiosqlite.Connection) -> int:
+    """Delete expired search cache entries"""
+    async with db.execute(PURGE_EXPIRED_CACHE_SQL) as cursor:
+        return cursor.rowcount
+
+async def sweep_search_cache(pool: ConnectionPool):
+    """Periodically purge expired search cache entries"""
+    while True:
+        try:
+            async with pool.acquire() as db:
+                deleted = await purge_expired_cache(db)
+            if deleted:
+                logger.info(f"Purged {deleted} expired search cache entries")
+        except Exception as e:
+            logger.error(f"Search cache sweep failed: {e}")
+        await asyncio.sleep(CACHE_SWEEP_INTERVAL)
+
+async def store_search_results(pool: ConnectionPool, batch: List[tuple]):
+    """Persist queued (cache_id, cache_key, body) search results in one transaction"""
+    rows = [
+        (cache_id, cache_key, zlib.compress(body, CACHE_COMPRESSION_LEVEL))
+        for cache_id, cache_key, body in batch
+    ]
+    try:
+        async with pool.acquire() as db:
+            await db.execute("BEGIN")
+            try:
+                await db.executemany(SEARCH_CACHE_INSERT_SQL, rows)
+                await db.execute("COMMIT")
+            except Exception:
+                await db.execute("ROLLBACK")
+                raise
+    except Exception as e:
+        logger.error(f"Failed to cache {len(rows)} search results: {e}")
+
+async def write_search_cache(pool: ConnectionPool, queue: asyncio.Queue):
+    """Drain queued search results into search_cache in batches until a None sentinel arrives"""
+    stopping = False
+    while not stopping:
+        item = await queue.get()
+        if item is None:
+            return
+        
+        batch = [item]
+        deadline = time.monotonic() + CACHE_WRITE_MAX_DELAY
+        
+        # Let concurrent misses pile up briefly so they share one commit
+        while len(batch) < CACHE_WRITE_BATCH_SIZE:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                break
+            if item is None:
+                stopping = True
+                break
+            batch.append(item)
+        
+        await store_search_results(pool, batch)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Set up the database and connection pool for the app's lifetime"""
+    init_db()
+    populate_sample_data()
+    app.state.db_pool = ConnectionPool(DB_POOL_SIZE)
+    await app.state.db_pool.open()
+    await web_scraper.start()
+    app.state.cache_sweeper = asyncio.create_task(sweep_search_cache(app.state.db_pool))
+    app.state.search_cache_writes = asyncio.Queue()
+    app.state.cache_writer = asyncio.create_task(
+        write_search_cache(app.state.db_pool, app.state.search_cache_writes)
+    )
+    if YAMLLoader is yaml.SafeLoader:
+        logger.warning("PyYAML was built without LibYAML; scraped YAML will use the slower pure-Python loader")
+    logger.info("MCP Playground API started with web scraping capabilities")
+    
+    yield
+    
+    app.state.cache_sweeper.cancel()
+    with suppress(asyncio.CancelledError):
+        await app.state.cache_sweeper
+    
+    # Let the writer flush everything queued before the pool closes
+    app.state.search_cache_writes.put_nowait(None)
+    await app.state.cache_writer
+    
+    await web_scraper.close()
+    await app.state.db_pool.close()
+
 # FastAPI app
 app = FastAPI(
     title="MCP.playground API",
     description="Backend API for Model Context Protocol testing with web scraping",
-    version="3.0.0"
+    version="3.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -78,8 +337,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Cache", "X-Next-Cursor"],
 )
 
+# Compress larger JSON responses (search results, MCP listings)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Pydantic models
 class WebMCPResult(BaseModel):
     name: str
@@ -111,13 +374,120 @@ class MCPListItem(BaseModel):
     stars: int
     created_at: str
 
+# Serializes result lists straight to JSON without an intermediate dict tree
+web_results_adapter = TypeAdapter(List[WebMCPResult])
+mcp_list_adapter = TypeAdapter(List[MCPListItem])
+
+# Keyword tables for domain/tag inference, built once at import
+DOMAIN_KEYWORDS = {
+    'weather': ('weather', 'climate', 'forecast', 'temperature'),
+    'finance': ('finance', 'trading', 'stock', 'crypto', 'payment'),
+    'travel': ('travel', 'booking', 'hotel', 'flight', 'airbnb'),
+    'productivity': ('calendar', 'task', 'note', 'email', 'schedule'),
+    'development': ('code', 'git', 'github', 'deploy', 'api'),
+    'social': ('social', 'twitter', 'facebook', 'instagram', 'post'),
+    'ecommerce': ('shop', 'store', 'product', 'cart', 'order'),
+    'data': ('data', 'analytics', 'database', 'query', 'search'),
+    'ai': ('ai', 'ml', 'llm', 'gpt', 'model'),
+    'communication': ('chat', 'message', 'slack', 'discord', 'teams')
+}
+
+# Common MCP-related tags
+TAG_KEYWORDS = {
+    'api': ('api', 'rest', 'endpoint'),
+    'web': ('web', 'http', 'url', 'browser'),
+    'database': ('db', 'database', 'sql'),
+    'cloud': ('aws', 'azure', 'gcp', 'cloud'),
+    'automation': ('auto', 'script', 'workflow'),
+    'integration': ('integrate', 'connect', 'sync'),
+    'realtime': ('realtime', 'live', 'stream'),
+    'security': ('auth', 'security', 'encrypt'),
+    'monitoring': ('monitor', 'log', 'metric')
+}
+
+def compile_keyword_patterns(table: Dict[str, tuple]) -> Dict[str, re.Pattern]:
+    """Compile each keyword group into one substring alternation"""
+    return {
+        key: re.compile('|'.join(re.escape(keyword) for keyword in keywords))
+        for key, keywords in table.items()
+    }
+
+# One regex scan per category instead of a Python `in` check per keyword
+DOMAIN_REGEXES = compile_keyword_patterns(DOMAIN_KEYWORDS)
+TAG_REGEXES = compile_keyword_patterns(TAG_KEYWORDS)
+
+# Domains that get a ranking boost
+BOOSTED_DOMAINS = frozenset({'ai', 'development', 'productivity'})
+
+# Patterns the scraper applies to every GitHub hit and awesome-list page
+GITHUB_REPO_REGEX = re.compile(r'github\.com/([^/]+/[^/]+)')
+MARKDOWN_LINK_REGEX = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after a fixed TTL"""
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict = OrderedDict()
+    
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        
+        # Keep recently read entries away from the eviction end
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        """Store value for ttl seconds, defaulting to the cache-wide TTL"""
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        
+        # Evict the least recently used entries once over capacity
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        self._entries.clear()
+
+# Serialized /mcps/search responses keyed by cache key; SQLite backs it across processes
+search_results_cache = TTLCache(maxsize=1024, ttl=SEARCH_CACHE_TTL)
+
+# Rendered /mcps pages as (body, etag) keyed by their filters; cleared whenever MCPs are written
+mcp_list_cache = TTLCache(maxsize=256, ttl=MCP_LIST_CACHE_TTL)
+
+# Web searches currently running, so identical concurrent queries share one upstream run
+inflight_web_searches: Dict[str, asyncio.Task] = {}
+
+async def coalesce_web_search(key: str, search: Callable[[], Awaitable[Any]]) -> Any:
+    """Run search once per key, letting concurrent callers await the same result"""
+    task = inflight_web_searches.get(key)
+    if task is None:
+        task = asyncio.ensure_future(search())
+        inflight_web_searches[key] = task
+        task.add_done_callback(lambda _: inflight_web_searches.pop(key, None))
+    
+    # Shielded so one disconnecting client does not cancel the search for the others
+    return await asyncio.shield(task)
+
 # Web scraper class
 class MCPWebScraper:
     def __init__(self):
         self.session_timeout = aiohttp.ClientTimeout(total=30, connect=10)
+        self.session: Optional[aiohttp.ClientSession] = None
         self.max_concurrent_requests = 5
         self.request_delay = 1.0
         
+        # Caps file fetches across all concurrent searches so bursts don't trip upstream rate limits
+        self.fetch_semaphore = asyncio.Semaphore(20)
+        
         # Known MCP file patterns
         self.mcp_file_patterns = [
             r'\.mcp\.json$',
@@ -138,28 +508,40 @@ class MCPWebScraper:
             r'def.*mcp.*tool'
         ]
 
+    async def start(self):
+        """Open the HTTP session shared by all searches"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                timeout=self.session_timeout,
+                headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+                connector=aiohttp.TCPConnector(limit=100, limit_per_host=30, ttl_dns_cache=300, keepalive_timeout=30)
+            )
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
     async def search_web_mcps(self, query: str, limit: int = 20) -> List[WebMCPResult]:
         """Main web scraping search function"""
         logger.info(f"Starting web scrape search for: {query}")
         
         results = []
         
-        async with aiohttp.ClientSession(
-            timeout=self.session_timeout,
-            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-        ) as session:
-            
-            # Search GitHub
-            github_results = await self._search_github(session, query, limit // 3)
-            results.extend(github_results)
-            
-            # Search general web
-            web_results = await self._search_general_web(session, query, limit // 3)
-            results.extend(web_results)
-            
-            # Search awesome lists
-            awesome_results = await self._search_awesome_lists(session, query, limit // 3)
-            results.extend(awesome_results)
+        # Reuse pooled connections (and their TLS sessions) across searches
+        await self.start()
+        session = self.session
+        
+        # Search GitHub, general web and awesome lists concurrently;
+        # gather keeps the source order for deduplication and ranking
+        source_results = await asyncio.gather(
+            self._search_github(session, query, limit // 3),
+            self._search_general_web(session, query, limit // 3),
+            self._search_awesome_lists(session, query, limit // 3)
+        )
+        for source_result in source_results:
+            results.extend(source_result)
         
         # Deduplicate and rank results
         unique_results = self._deduplicate_results(results)
@@ -192,10 +574,10 @@ class MCPWebScraper:
                             # Parse GitHub search results
                             search_results = soup.select('.search-result-item, .Box-row')
                             
-                            for result_elem in search_results[:limit]:
-                                mcp = await self._parse_github_result(session, result_elem, query)
-                                if mcp:
-                                    results.append(mcp)
+                            results.extend(await self._gather_in_batches([
+                                functools.partial(self._parse_github_result, session, result_elem, query)
+                                for result_elem in search_results[:limit]
+                            ]))
                         
                         elif response.status == 429:
                             logger.warning("GitHub rate limit hit")
@@ -225,54 +607,53 @@ class MCPWebScraper:
             url = urljoin('https://github.com', href)
             
             # Extract repository info
-            repo_match = re.search(r'github\.com/([^/]+/[^/]+)', url)
+            repo_match = GITHUB_REPO_REGEX.search(url)
             repository = repo_match.group(1) if repo_match else None
             
             # Get raw file URL
             raw_url = url.replace('/blob/', '/raw/')
             
-            # Fetch file content
             content = await self._fetch_file_content(session, raw_url)
-            if not content or not self._is_valid_mcp_content(content):
+            if not content:
                 return None
             
-            # Extract metadata
-            name = self._extract_name_from_content(content) or f"mcp-{repository.split('/')[-1] if repository else 'unknown'}"
-            description = self._extract_description_from_content(content) or f"MCP from {repository}"
-            domain = self._extract_domain_from_content(content)
-            tags = self._extract_tags_from_content(content, name, description)
-            confidence = self._calculate_confidence_score(content, url, name, description)
-            
-            # Parse schema
-            schema = None
-            file_type = 'json' if url.endswith('.json') else 'yaml'
-            try:
-                if file_type == 'json':
-                    schema = json.loads(content)
-                else:
-                    schema = yaml.safe_load(content)
-            except:
-                pass
-            
-            return WebMCPResult(
-                name=name,
-                description=description,
-                source_url=url,
-                tags=tags,
-                domain=domain,
-                validated=schema is not None,
-                schema=schema,
-                file_type=file_type,
-                repository=repository,
-                stars=None,  # Would need GitHub API for this
-                source_platform="github",
-                confidence_score=confidence
-            )
+            # Parsing and scoring are CPU-bound; keep them off the event loop
+            return await asyncio.to_thread(self._build_github_result, content, url, repository)
             
         except Exception as e:
             logger.error(f"Error parsing GitHub result: {e}")
             return None
 
+    def _build_github_result(self, content: str, url: str, repository: Optional[str]) -> Optional[WebMCPResult]:
+        """Parse fetched GitHub file content into a result if it is a valid MCP"""
+        # Parse once for all extractors
+        data = self._parse_content(content)
+        if not self._is_valid_mcp_content(data):
+            return None
+        
+        # Extract metadata
+        name = self._extract_name_from_content(data) or f"mcp-{repository.split('/')[-1] if repository else 'unknown'}"
+        description = self._extract_description_from_content(data) or f"MCP from {repository}"
+        domain = self._extract_domain_from_content(data)
+        tags = self._extract_tags_from_content(data, name, description)
+        confidence = self._calculate_confidence_score(data, url, name, description)
+        file_type = 'json' if url.endswith('.json') else 'yaml'
+        
+        return WebMCPResult(
+            name=name,
+            description=description,
+            source_url=url,
+            tags=tags,
+            domain=domain,
+            validated=True,
+            schema=data,
+            file_type=file_type,
+            repository=repository,
+            stars=None,  # Would need GitHub API for this
+            source_platform="github",
+            confidence_score=confidence
+        )
+
     async def _search_general_web(self, session: aiohttp.ClientSession, query: str, limit: int) -> List[WebMCPResult]:
         """Search general web for MCP content"""
         results = []
@@ -291,12 +672,12 @@ class MCPWebScraper:
                     # Extract search result links
                     links = soup.select('a[href*="http"]')
                     
-                    for link in links[:limit]:
-                        href = link.get('href', '')
-                        if any(pattern in href for pattern in ['.json', '.yaml', 'mcp']):
-                            mcp = await self._fetch_and_validate_mcp(session, href, "", query)
-                            if mcp:
-                                results.append(mcp)
+                    hrefs = [link.get('href', '') for link in links[:limit]]
+                    results.extend(await self._gather_in_batches([
+                        functools.partial(self._fetch_and_validate_mcp, session, href, "", query)
+                        for href in hrefs
+                        if any(pattern in href for pattern in ['.json', '.yaml', 'mcp'])
+                    ]))
                                 
         except Exception as e:
             logger.error(f"General web search failed: {e}")
@@ -323,27 +704,22 @@ class MCPWebScraper:
                         
                         if url.endswith('.md'):
                             # Parse markdown for links
-                            links = re.findall(r'\[([^\]]+)\]\(([^)]+)\)', content)
+                            links = MARKDOWN_LINK_REGEX.findall(content)
                             
-                            for title, link_url in links:
-                                if 'github.com' in link_url:
-                                    mcp = await self._fetch_and_validate_mcp(session, link_url, title, query)
-                                    if mcp:
-                                        results.append(mcp)
-                                        if len(results) >= limit:
-                                            break
+                            results.extend(await self._gather_in_batches([
+                                functools.partial(self._fetch_and_validate_mcp, session, link_url, title, query)
+                                for title, link_url in links
+                                if 'github.com' in link_url
+                            ], limit=limit - len(results)))
                         else:
                             # Parse HTML for repository links
                             soup = BeautifulSoup(content, 'html.parser')
                             repo_links = soup.select('a[href*="github.com"]')
                             
-                            for link in repo_links[:limit]:
-                                href = link.get('href', '')
-                                title = link.get_text(strip=True)
-                                
-                                mcp = await self._fetch_and_validate_mcp(session, href, title, query)
-                                if mcp:
-                                    results.append(mcp)
+                            results.extend(await self._gather_in_batches([
+                                functools.partial(self._fetch_and_validate_mcp, session, link.get('href', ''), link.get_text(strip=True), query)
+                                for link in repo_links[:limit]
+                            ]))
                                     
             except Exception as e:
                 logger.error(f"Error searching awesome list {url}: {e}")
@@ -351,53 +727,69 @@ class MCPWebScraper:
         
         return results
 
+    async def _gather_in_batches(
+        self,
+        fetches: List[Callable[[], Awaitable[Optional[WebMCPResult]]]],
+        limit: Optional[int] = None
+    ) -> List[WebMCPResult]:
+        """Run fetches max_concurrent_requests at a time, stopping once limit results are found"""
+        results = []
+        
+        for start in range(0, len(fetches), self.max_concurrent_requests):
+            if limit is not None and len(results) >= limit:
+                break
+            
+            batch = fetches[start:start + self.max_concurrent_requests]
+            batch_results = await asyncio.gather(*(fetch() for fetch in batch))
+            results.extend(mcp for mcp in batch_results if mcp)
+        
+        return results if limit is None else results[:limit]
+
     async def _fetch_and_validate_mcp(self, session: aiohttp.ClientSession, url: str, title: str, query: str) -> Optional[WebMCPResult]:
         """Fetch content from URL and validate if it's a valid MCP"""
         try:
             content = await self._fetch_file_content(session, url)
-            
-            if content and self._is_valid_mcp_content(content):
-                file_type = 'json' if url.endswith('.json') else 'yaml'
-                domain = self._extract_domain_from_content(content)
-                tags = self._extract_tags_from_content(content, title, "")
-                confidence = self._calculate_confidence_score(content, url, title, "")
-                
-                # Parse schema
-                schema = None
-                try:
-                    if file_type == 'json':
-                        schema = json.loads(content)
-                    else:
-                        schema = yaml.safe_load(content)
-                except:
-                    pass
-                
-                return WebMCPResult(
-                    name=self._extract_name_from_content(content) or title or "Unknown MCP",
-                    description=self._extract_description_from_content(content) or f"MCP found at {url}",
-                    source_url=url,
-                    tags=tags,
-                    domain=domain,
-                    validated=schema is not None,
-                    schema=schema,
-                    file_type=file_type,
-                    repository=None,
-                    stars=None,
-                    source_platform="web",
-                    confidence_score=confidence
-                )
+            if content:
+                # Parsing and scoring are CPU-bound; keep them off the event loop
+                return await asyncio.to_thread(self._build_web_result, content, url, title)
                 
         except Exception as e:
             logger.error(f"Error fetching and validating MCP from {url}: {e}")
             
         return None
 
+    def _build_web_result(self, content: str, url: str, title: str) -> Optional[WebMCPResult]:
+        """Parse fetched file content into a result if it is a valid MCP"""
+        data = self._parse_content(content)
+        if not self._is_valid_mcp_content(data):
+            return None
+        
+        file_type = 'json' if url.endswith('.json') else 'yaml'
+        domain = self._extract_domain_from_content(data)
+        tags = self._extract_tags_from_content(data, title, "")
+        confidence = self._calculate_confidence_score(data, url, title, "")
+        
+        return WebMCPResult(
+            name=self._extract_name_from_content(data) or title or "Unknown MCP",
+            description=self._extract_description_from_content(data) or f"MCP found at {url}",
+            source_url=url,
+            tags=tags,
+            domain=domain,
+            validated=True,
+            schema=data,
+            file_type=file_type,
+            repository=None,
+            stars=None,
+            source_platform="web",
+            confidence_score=confidence
+        )
+
     async def _fetch_file_content(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
         """Fetch file content from URL"""
         try:
             await asyncio.sleep(self.request_delay)
             
-            async with session.get(url) as response:
+            async with self.fetch_semaphore, session.get(url) as response:
                 if response.status == 200:
                     content = await response.text()
                     return content
@@ -407,19 +799,20 @@ class MCPWebScraper:
             
         return None
 
-    def _is_valid_mcp_content(self, content: str) -> bool:
-        """Check if content appears to be a valid MCP schema"""
+    def _parse_content(self, content: str) -> Any:
+        """Parse raw MCP content as JSON, falling back to YAML"""
         try:
-            # Try to parse as JSON first
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Try YAML
             try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                # Try YAML
-                try:
-                    data = yaml.safe_load(content)
-                except yaml.YAMLError:
-                    return False
-            
+                return yaml.load(content, Loader=YAMLLoader)
+            except yaml.YAMLError:
+                return None
+
+    def _is_valid_mcp_content(self, data: Any) -> bool:
+        """Check if parsed content appears to be a valid MCP schema"""
+        try:
             # Check for MCP-like structure
             if not isinstance(data, dict):
                 return False
@@ -444,40 +837,17 @@ class MCPWebScraper:
         except Exception:
             return False
 
-    def _extract_name_from_content(self, content: str) -> Optional[str]:
-        """Extract MCP name from content"""
-        try:
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(content)
-            
-            return data.get('name')
-            
-        except Exception:
-            return None
+    def _extract_name_from_content(self, data: Dict[str, Any]) -> Optional[str]:
+        """Extract MCP name from parsed content"""
+        return data.get('name')
 
-    def _extract_description_from_content(self, content: str) -> Optional[str]:
-        """Extract MCP description from content"""
-        try:
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(content)
-            
-            return data.get('description')
-            
-        except Exception:
-            return None
+    def _extract_description_from_content(self, data: Dict[str, Any]) -> Optional[str]:
+        """Extract MCP description from parsed content"""
+        return data.get('description')
 
-    def _extract_domain_from_content(self, content: str) -> str:
-        """Extract domain/category from MCP content"""
+    def _extract_domain_from_content(self, data: Dict[str, Any]) -> str:
+        """Extract domain/category from parsed MCP content"""
         try:
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(content)
-            
             # Check for explicit domain
             if 'domain' in data:
                 return data['domain']
@@ -485,21 +855,8 @@ class MCPWebScraper:
             # Infer from name or description
             text = f"{data.get('name', '')} {data.get('description', '')}".lower()
             
-            domain_keywords = {
-                'weather': ['weather', 'climate', 'forecast', 'temperature'],
-                'finance': ['finance', 'trading', 'stock', 'crypto', 'payment'],
-                'travel': ['travel', 'booking', 'hotel', 'flight', 'airbnb'],
-                'productivity': ['calendar', 'task', 'note', 'email', 'schedule'],
-                'development': ['code', 'git', 'github', 'deploy', 'api'],
-                'social': ['social', 'twitter', 'facebook', 'instagram', 'post'],
-                'ecommerce': ['shop', 'store', 'product', 'cart', 'order'],
-                'data': ['data', 'analytics', 'database', 'query', 'search'],
-                'ai': ['ai', 'ml', 'llm', 'gpt', 'model'],
-                'communication': ['chat', 'message', 'slack', 'discord', 'teams']
-            }
-            
-            for domain, keywords in domain_keywords.items():
-                if any(keyword in text for keyword in keywords):
+            for domain, pattern in DOMAIN_REGEXES.items():
+                if pattern.search(text):
                     return domain
             
             return 'general'
@@ -507,62 +864,38 @@ class MCPWebScraper:
         except Exception:
             return 'general'
 
-    def _extract_tags_from_content(self, content: str, title: str, description: str) -> List[str]:
-        """Extract tags from MCP content and metadata"""
-        tags = set()
+    def _extract_tags_from_content(self, data: Dict[str, Any], title: str, description: str) -> List[str]:
+        """Extract tags from parsed MCP content and metadata"""
+        # Dict keys dedupe like a set but keep first-seen order, so tag lists are stable
+        tags: Dict[str, None] = {}
         
         try:
-            # Parse content
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(content)
-            
             # Add explicit tags if present
             if 'tags' in data:
-                tags.update(data['tags'])
+                tags.update(dict.fromkeys(data['tags']))
             
             # Extract from tool names
             for tool in data.get('tools', []):
                 tool_name = tool.get('name', '').lower()
-                tags.add(tool_name.split('_')[0])  # First part of tool name
+                tags[tool_name.split('_')[0]] = None  # First part of tool name
             
             # Extract from text content
             text = f"{title} {description} {data.get('name', '')} {data.get('description', '')}".lower()
             
-            # Common MCP-related tags
-            tag_patterns = {
-                'api': ['api', 'rest', 'endpoint'],
-                'web': ['web', 'http', 'url', 'browser'],
-                'database': ['db', 'database', 'sql'],
-                'cloud': ['aws', 'azure', 'gcp', 'cloud'],
-                'automation': ['auto', 'script', 'workflow'],
-                'integration': ['integrate', 'connect', 'sync'],
-                'realtime': ['realtime', 'live', 'stream'],
-                'security': ['auth', 'security', 'encrypt'],
-                'monitoring': ['monitor', 'log', 'metric']
-            }
-            
-            for tag, patterns in tag_patterns.items():
-                if any(pattern in text for pattern in patterns):
-                    tags.add(tag)
+            for tag, pattern in TAG_REGEXES.items():
+                if pattern.search(text):
+                    tags[tag] = None
             
         except Exception:
             pass
         
         return list(tags)
 
-    def _calculate_confidence_score(self, content: str, url: str, title: str, description: str) -> float:
+    def _calculate_confidence_score(self, data: Dict[str, Any], url: str, title: str, description: str) -> float:
         """Calculate confidence score for MCP result"""
         score = 0.5  # Base score
         
         try:
-            # Parse content for quality assessment
-            try:
-                data = json.loads(content)
-            except json.JSONDecodeError:
-                data = yaml.safe_load(content)
-            
             # Schema completeness
             if data.get('description'):
                 score += 0.1
@@ -594,16 +927,16 @@ class MCPWebScraper:
         return min(score, 1.0)
 
     def _deduplicate_results(self, results: List[WebMCPResult]) -> List[WebMCPResult]:
-        """Remove duplicate results based on content hash"""
-        seen_hashes = set()
+        """Remove duplicate results based on name and URL"""
+        seen_keys = set()
         unique_results = []
         
         for result in results:
-            # Create hash from content and URL
-            content_hash = hashlib.md5(f"{result.name}{result.source_url}".encode()).hexdigest()
+            # The set hashes the tuple directly; no digest needed in-process
+            key = (result.name, result.source_url)
             
-            if content_hash not in seen_hashes:
-                seen_hashes.add(content_hash)
+            if key not in seen_keys:
+                seen_keys.add(key)
                 unique_results.append(result)
         
         return unique_results
@@ -622,7 +955,7 @@ class MCPWebScraper:
                 score += 0.1
             
             # Boost for certain domains
-            if result.domain in ['ai', 'development', 'productivity']:
+            if result.domain in BOOSTED_DOMAINS:
                 score += 0.05
             
             return score
@@ -638,7 +971,7 @@ SAMPLE_MCPS = [
         "id": "weather-001",
         "name": "weather-forecast",
         "description": "Real-time weather data and forecasting with global coverage",
-        "schema_content": json.dumps({
+        "schema_content": orjson.dumps({
             "name": "weather-forecast",
             "version": "1.0.0",
             "description": "Real-time weather data and forecasting",
@@ -653,7 +986,7 @@ SAMPLE_MCPS = [
                 }
             ]
         }),
-        "tags": json.dumps(["weather", "forecast", "api"]),
+        "tags": orjson.dumps(["weather", "forecast", "api"]).decode(),
         "domain": "weather",
         "validated": True,
         "popularity": 95,
@@ -668,7 +1001,7 @@ SAMPLE_MCPS = [
         "id": "filesystem-002",
         "name": "filesystem-operations",
         "description": "Secure file system operations with read/write capabilities",
-        "schema_content": json.dumps({
+        "schema_content": orjson.dumps({
             "name": "filesystem-operations",
             "version": "1.0.0",
             "description": "File system operations",
@@ -690,7 +1023,7 @@ SAMPLE_MCPS = [
                 }
             ]
         }),
-        "tags": json.dumps(["filesystem", "files", "io"]),
+        "tags": orjson.dumps(["filesystem", "files", "io"]).decode(),
         "domain": "development",
         "validated": True,
         "popularity": 88,
@@ -703,135 +1036,311 @@ SAMPLE_MCPS = [
     }
 ]
 
+# Bound parameters for the seed statements, encoded once at import
+SAMPLE_MCP_ID_ROWS = [(mcp["id"],) for mcp in SAMPLE_MCPS]
+SAMPLE_MCP_ROWS = [
+    (
+        mcp["id"],
+        mcp["name"],
+        mcp["description"],
+        zlib.compress(mcp["schema_content"], SCHEMA_COMPRESSION_LEVEL),
+        mcp["tags"],
+        mcp["domain"],
+        mcp["validated"],
+        mcp["popularity"],
+        mcp["source_url"],
+        mcp["source_platform"],
+        mcp["confidence_score"],
+        mcp["file_type"],
+        mcp["repository"],
+        mcp["stars"]
+    )
+    for mcp in SAMPLE_MCPS
+]
+SAMPLE_MCP_TAG_ROWS = [
+    (mcp["id"], tag)
+    for mcp in SAMPLE_MCPS
+    for tag in orjson.loads(mcp["tags"])
+]
+
 def populate_sample_data():
     """Populate database with sample MCP data"""
-    conn = sqlite3.connect(DATABASE_PATH)
+    conn = connect_setup_db()
     cursor = conn.cursor()
     
-    for mcp in SAMPLE_MCPS:
-        cursor.execute('''
-            INSERT OR REPLACE INTO mcps (id, name, description, schema_content, tags, domain, validated, popularity, source_url, source_platform, confidence_score, file_type, repository, stars)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (
-            mcp["id"],
-            mcp["name"],
-            mcp["description"],
-            mcp["schema_content"],
-            mcp["tags"],
-            mcp["domain"],
-            mcp["validated"],
-            mcp["popularity"],
-            mcp["source_url"],
-            mcp["source_platform"],
-            mcp["confidence_score"],
-            mcp["file_type"],
-            mcp["repository"],
-            mcp["stars"]
-        ))
+    # Dev reloads restart the app on every save; leave an already seeded database alone
+    (seeded_version,) = cursor.execute("PRAGMA user_version").fetchone()
+    if seeded_version >= SAMPLE_DATA_VERSION:
+        conn.close()
+        return
+    
+    # One statement and one transaction for all sample rows
+    cursor.executemany(INSERT_MCP_SQL, SAMPLE_MCP_ROWS)
+    
+    # Keep the normalized tag rows in step with the replaced MCPs
+    cursor.executemany(DELETE_MCP_TAGS_SQL, SAMPLE_MCP_ID_ROWS)
+    cursor.executemany(INSERT_MCP_TAG_SQL, SAMPLE_MCP_TAG_ROWS)
+    
+    # INSERT OR REPLACE assigns new rowids, so resync the external-content index
+    cursor.execute("INSERT INTO mcps_fts(mcps_fts) VALUES('rebuild')")
+    cursor.execute(f"PRAGMA user_version={SAMPLE_DATA_VERSION}")
     
     conn.commit()
     conn.close()
+    
+    mcp_list_cache.clear()
+
+# Fixed /health fields; timestamp and database are filled in per render, keeping their position
+HEALTH_TEMPLATE = {
+    "status": "healthy",
+    "timestamp": None,
+    "database": None,
+    "scraping_enabled": True,
+    "supported_platforms": ["GitHub", "General Web", "Awesome Lists"],
+    "version": "3.0.0",
+    "features": [
+        "web_scraping",
+        "mcp_validation",
+        "confidence_scoring",
+        "beautifulsoup4_integration"
+    ]
+}
+
+# Last rendered /health body and its monotonic expiry
+health_cache = {"expires_at": 0.0, "body": b""}
 
 # API Endpoints
-@app.on_event("startup")
-async def startup_event():
-    init_db()
-    populate_sample_data()
-    logger.info("MCP Playground API started with web scraping capabilities")
+# The root payload never changes, so it is encoded once at import
+ROOT_BODY = orjson.dumps({
+    "message": "MCP.playground API with Web Scraping",
+    "version": "3.0.0",
+    "features": [
+        "Web scraping with BeautifulSoup4",
+        "GitHub MCP discovery",
+        "Real-time web content extraction",
+        "MCP validation and confidence scoring"
+    ]
+})
 
 @app.get("/")
 async def root():
-    return {
-        "message": "MCP.playground API with Web Scraping",
-        "version": "3.0.0",
-        "features": [
-            "Web scraping with BeautifulSoup4",
-            "GitHub MCP discovery",
-            "Real-time web content extraction",
-            "MCP validation and confidence scoring"
-        ]
-    }
+    return Response(content=ROOT_BODY, media_type="application/json")
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "database": "connected" if os.path.exists(DATABASE_PATH) else "disconnected",
-        "scraping_enabled": True,
-        "supported_platforms": ["GitHub", "General Web", "Awesome Lists"],
-        "version": "3.0.0",
-        "features": [
-            "web_scraping",
-            "mcp_validation",
-            "confidence_scoring",
-            "beautifulsoup4_integration"
-        ]
-    }
+    # Monitors probe this endpoint at high rates; rebuild the body at most once per HEALTH_CACHE_TTL
+    now = time.monotonic()
+    if now >= health_cache["expires_at"]:
+        health_cache["body"] = orjson.dumps({
+            **HEALTH_TEMPLATE,
+            "timestamp": datetime.now().isoformat(),
+            # The connection pool is opened once in lifespan; no need to stat the file per probe
+            "database": "connected" if getattr(app.state, "db_pool", None) is not None else "disconnected"
+        })
+        health_cache["expires_at"] = now + HEALTH_CACHE_TTL
+    
+    return Response(content=health_cache["body"], media_type="application/json")
+
+def row_to_mcp_list_item(row: tuple, tags: Optional[List[str]]) -> MCPListItem:
+    """Build an MCPListItem from a row selected with MCP_LIST_COLUMNS and its decoded tags"""
+    (mcp_id, name, description, _, domain, validated, popularity, source_url,
+     source_platform, confidence_score, file_type, repository, stars, created_at) = row
+    # Rows come from our own schema, so skip pydantic validation
+    return MCPListItem.model_construct(
+        id=mcp_id,
+        name=name,
+        description=description or "",
+        tags=tags or [],
+        domain=domain or "general",
+        validated=bool(validated),
+        popularity=popularity or 0,
+        source_url=source_url,
+        source_platform=source_platform or "local",
+        confidence_score=confidence_score or 0.0,
+        file_type=file_type or "json",
+        repository=repository,
+        stars=stars or 0,
+        created_at=created_at or datetime.now().isoformat()
+    )
+
+def rows_to_mcp_list_items(rows: List[tuple]) -> List[MCPListItem]:
+    """Build MCPListItems for a page of rows, decoding each row's tags column"""
+    items = []
+    for row in rows:
+        # Decoded per row so a malformed value can't bleed into its neighbours
+        tags = orjson.loads(row[3]) if row[3] else []
+        # model_construct skips validation, so enforce the List[str] schema here
+        if not isinstance(tags, list):
+            raise ValueError(f"MCP {row[0]} has non-list tags")
+        items.append(row_to_mcp_list_item(row, tags))
+    return items
+
+def encode_mcps_cursor(row: tuple, sort_by: str) -> str:
+    """Encode the keyset position after row for the next /mcps page"""
+    _, position, _ = MCP_SORT_KEYS.get(sort_by, MCP_SORT_KEYS["popularity"])
+    return base64.urlsafe_b64encode(orjson.dumps([row[position], row[0]])).decode()
+
+def decode_mcps_cursor(cursor: str) -> List[Any]:
+    """Decode a /mcps cursor into its (sort value, id) bind parameters"""
+    try:
+        position = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (ValueError, orjson.JSONDecodeError):
+        position = None
+    
+    # Values are bound into SQL and hashed into the page cache key, so only accept scalars
+    if (
+        not isinstance(position, list)
+        or len(position) != 2
+        or not isinstance(position[0], (str, int, float, type(None)))
+        or not isinstance(position[1], str)
+    ):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    return position
+
+@functools.lru_cache(maxsize=64)
+def build_mcps_query(has_domain: bool, has_validated: bool, tag_count: int, sort_by: str, has_cursor: bool = False, cursor_at_null: bool = False) -> str:
+    """Build the /mcps SQL for a combination of active filters
+    
+    Parameters are bound in order: domain, validated, tags, cursor, limit.
+    A cursor binds (sort value, id), or only id when cursor_at_null.
+    """
+    query = f"SELECT {MCP_LIST_COLUMNS} FROM mcps WHERE 1=1"
+    
+    if has_domain:
+        query += " AND domain = ?"
+    
+    if has_validated:
+        query += " AND validated = ?"
+    
+    if tag_count:
+        # Resolve matching MCP ids through the mcp_tags index
+        placeholders = ",".join("?" * tag_count)
+        query += f" AND id IN (SELECT mcp_id FROM mcp_tags WHERE tag IN ({placeholders}))"
+    
+    column, _, descending = MCP_SORT_KEYS.get(sort_by, MCP_SORT_KEYS["popularity"])
+    
+    if has_cursor:
+        # Keyset pagination: seek past the last row of the previous page, id breaking ties.
+        # Row-value comparisons are never true for NULL, and SQLite sorts NULLs first
+        # ascending and last descending, so the NULL run is handled explicitly.
+        op = '<' if descending else '>'
+        if cursor_at_null:
+            query += f" AND (({column} IS NULL AND id {op} ?)"
+            query += ")" if descending else f" OR {column} IS NOT NULL)"
+        else:
+            query += f" AND (({column}, id) {op} (?, ?)"
+            query += f" OR {column} IS NULL)" if descending else ")"
+    
+    direction = " DESC" if descending else ""
+    query += f" ORDER BY {column}{direction}, id{direction}"
+    query += " LIMIT ?"
+    
+    return query
 
 @app.get("/mcps", response_model=List[MCPListItem])
 async def get_mcps(
+    request: Request,
     domain: Optional[str] = Query(None),
-    tags: Optional[str] = Query(None),
+    tags: Optional[str] = Query(None, description="Comma-separated list of tags"),
     validated: Optional[bool] = Query(None),
     sort_by: str = Query("popularity"),
-    limit: int = Query(50, ge=1, le=100)
+    limit: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor value from the previous page")
 ):
     """Get local MCPs with filtering"""
-    conn = sqlite3.connect(DATABASE_PATH)
-    cursor = conn.cursor()
-    
-    query = "SELECT * FROM mcps WHERE 1=1"
     params = []
     
-    if domain and domain != 'all':
-        query += " AND domain = ?"
+    has_domain = bool(domain) and domain != 'all'
+    if has_domain:
         params.append(domain)
     
     if validated is not None:
-        query += " AND validated = ?"
         params.append(validated)
     
-    if tags:
-        query += " AND tags LIKE ?"
-        params.append(f"%{tags}%")
-    
-    # Add sorting
-    if sort_by == "name":
-        query += " ORDER BY name"
-    elif sort_by == "created_at":
-        query += " ORDER BY created_at DESC"
-    elif sort_by == "confidence_score":
-        query += " ORDER BY confidence_score DESC"
+    tag_list = [tag.strip() for tag in tags.split(",") if tag.strip()] if tags else []
+    params.extend(tag_list)
+    
+    cursor_at_null = False
+    if cursor:
+        sort_value, last_id = decode_mcps_cursor(cursor)
+        cursor_at_null = sort_value is None
+        params.extend([last_id] if cursor_at_null else [sort_value, last_id])
+    
+    params.append(limit)
+    
+    cache_key = tuple(params) + (has_domain, validated is not None, len(tag_list), bool(cursor), cursor_at_null, sort_by)
+    cached = mcp_list_cache.get(cache_key)
+    if cached is not None:
+        body, etag, next_cursor = cached
     else:
-        query += " ORDER BY popularity DESC"
+        query = build_mcps_query(has_domain, validated is not None, len(tag_list), sort_by, bool(cursor), cursor_at_null)
+        
+        async with app.state.db_pool.acquire() as db:
+            async with db.execute(query, params) as db_cursor:
+                rows = await db_cursor.fetchall()
+        
+        mcps = rows_to_mcp_list_items(rows)
+        body = mcp_list_adapter.dump_json(mcps)
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        # A full page may have more rows after it
+        next_cursor = encode_mcps_cursor(rows[-1], sort_by) if len(rows) == limit else None
+        mcp_list_cache.set(cache_key, (body, etag, next_cursor))
     
-    query += f" LIMIT {limit}"
+    # Local MCPs change rarely: let browsers/proxies cache the list briefly
+    # and answer revalidations with 304 instead of resending the body
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={MCP_LIST_CACHE_TTL}"}
+    if next_cursor:
+        headers["X-Next-Cursor"] = next_cursor
     
-    cursor.execute(query, params)
-    rows = cursor.fetchall()
-    conn.close()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
     
-    mcps = []
-    for row in rows:
-        mcps.append(MCPListItem(
-            id=row[0],
-            name=row[1],
-            description=row[2] or "",
-            tags=json.loads(row[4]) if row[4] else [],
-            domain=row[5] or "general",
-            validated=bool(row[6]),
-            popularity=row[7] or 0,
-            source_url=row[8],
-            source_platform=row[9] or "local",
-            confidence_score=row[10] or 0.0,
-            file_type=row[11] or "json",
-            repository=row[12],
-            stars=row[13] or 0,
-            created_at=row[14] or datetime.now().isoformat()
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def build_fts_query(query: str) -> str:
+    """Quote each search term so user input is never parsed as FTS5 syntax"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+async def search_local_mcps(db: aiosqlite.Connection, query: str, limit: int) -> List[WebMCPResult]:
+    """Full-text search the local MCP library, best bm25 matches first"""
+    match = build_fts_query(query)
+    if not match:
+        return []
+    
+    async with db.execute(LOCAL_SEARCH_SQL, (match, limit)) as cursor:
+        rows = await cursor.fetchall()
+    
+    results = []
+    for (name, description, source_url, tags, domain, validated, schema_content,
+         file_type, repository, stars, source_platform, confidence_score) in rows:
+        try:
+            schema = orjson.loads(decompress_json_column(schema_content)) if schema_content else None
+        except (orjson.JSONDecodeError, zlib.error):
+            schema = None
+        
+        results.append(WebMCPResult.model_construct(
+            name=name,
+            description=description or "",
+            source_url=source_url or "",
+            tags=orjson.loads(tags) if tags else [],
+            domain=domain or "general",
+            validated=bool(validated),
+            schema=schema if isinstance(schema, dict) else None,
+            file_type=file_type or "json",
+            repository=repository,
+            stars=stars,
+            source_platform=source_platform or "local",
+            confidence_score=confidence_score or 0.0
         ))
     
-    return mcps
+    return results
+
+def search_cache_key(endpoint: str, query: str, limit: int, sources: str, min_confidence: float, use_scraping: bool) -> str:
+    """Fixed-size digest identifying a search request, so cache keys stay short however long the query"""
+    # JSON-encoded so no query text can shift its way into another field or endpoint
+    raw = orjson.dumps([endpoint, query, limit, sources, min_confidence, use_scraping])
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
 
 @app.get("/mcps/search", response_model=List[WebMCPResult])
 async def search_web_mcps(
@@ -846,46 +1355,56 @@ async def search_web_mcps(
         start_time = time.time()
         
         # Check cache first
-        cache_key = f"search:{query}:{limit}:{sources}:{min_confidence}"
-        conn = sqlite3.connect(DATABASE_PATH)
-        cursor = conn.cursor()
-        cursor.execute(
-            "SELECT results FROM search_cache WHERE query = ? AND expires_at > datetime('now')",
-            (cache_key,)
-        )
-        cached_result = cursor.fetchone()
+        cache_key = search_cache_key("search", query, limit, sources, min_confidence, use_scraping)
+        cached_body = search_results_cache.get(cache_key)
+        if cached_body is not None:
+            logger.info(f"Returning in-memory cached results for query: {query}")
+            return Response(content=cached_body, media_type="application/json", headers={"X-Cache": "HIT"})
+        
+        async with app.state.db_pool.acquire() as db:
+            async with db.execute(SEARCH_CACHE_LOOKUP_SQL, (cache_key,)) as cursor:
+                cached_result = await cursor.fetchone()
         
         if cached_result:
-            conn.close()
-            cached_data = json.loads(cached_result[0])
             logger.info(f"Returning cached results for query: {query}")
-            return [WebMCPResult(**item) for item in cached_data[:limit]]
+            # The cached payload is the exact response body that was sent on the miss
+            cached_body = decompress_json_column(cached_result[0])
+            # Expire from memory together with the SQLite row, not a full TTL after this hit
+            search_results_cache.set(cache_key, cached_body, ttl=cached_result[1])
+            return Response(content=cached_body, media_type="application/json", headers={"X-Cache": "HIT"})
         
-        # Perform web scraping search
-        if use_scraping:
+        # Serve from the local full-text index first
+        async with app.state.db_pool.acquire() as db:
+            results = await search_local_mcps(db, query, limit)
+        
+        # Only go to the web when the local library cannot fill the page
+        if len(results) >= limit:
+            logger.info(f"Local library satisfied search for: {query}")
+        elif use_scraping:
             logger.info(f"Starting web scraping search for: {query}")
-            results = await web_scraper.search_web_mcps(query, limit)
+            web_results = await coalesce_web_search(
+                f"{query}:{limit}",
+                functools.partial(web_scraper.search_web_mcps, query, limit)
+            )
+            results = web_scraper._deduplicate_results(results + web_results)[:limit]
         else:
-            logger.info(f"Scraping disabled, returning empty results")
-            results = []
+            logger.info(f"Scraping disabled, returning {len(results)} local results")
         
         # Filter by confidence score
         filtered_results = [r for r in results if r.confidence_score >= min_confidence]
         
-        # Cache results
-        cache_id = f"cache_{int(time.time())}"
-        search_duration = int((time.time() - start_time) * 1000)
+        # Serialize once: the same bytes are cached and sent to the client
+        body = web_results_adapter.dump_json(filtered_results)
         
-        cursor.execute(
-            "INSERT INTO search_cache (id, query, results, created_at, expires_at) VALUES (?, ?, ?, datetime('now'), datetime('now', '+1 hour'))",
-            (cache_id, cache_key, json.dumps([r.dict() for r in filtered_results]))
-        )
+        # Cache results; the SQLite write is batched by the cache writer task
+        cache_id = uuid.uuid4().hex
+        search_duration = int((time.time() - start_time) * 1000)
         
-        conn.commit()
-        conn.close()
+        search_results_cache.set(cache_key, body)
+        app.state.search_cache_writes.put_nowait((cache_id, cache_key, body))
         
         logger.info(f"Web scraping search completed for '{query}': {len(filtered_results)} results in {search_duration}ms")
-        return filtered_results
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
         
     except Exception as e:
         logger.error(f"Web search failed for query '{query}': {str(e)}")
@@ -900,15 +1419,26 @@ async def enhanced_search_mcps(request: dict):
         use_web_scraping = request.get("use_web_scraping", True)
         min_confidence = request.get("min_confidence", 0.0)
         
+        # Web-only results, namespaced apart from /mcps/search entries
+        cache_key = search_cache_key("enhanced", query, limit, "", min_confidence, use_web_scraping)
+        cached_body = search_results_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json", headers={"X-Cache": "HIT"})
+        
         if use_web_scraping:
-            results = await web_scraper.search_web_mcps(query, limit)
+            results = await coalesce_web_search(
+                f"{query}:{limit}",
+                functools.partial(web_scraper.search_web_mcps, query, limit)
+            )
         else:
             results = []
         
         # Apply confidence filter
         filtered_results = [r for r in results if r.confidence_score >= min_confidence]
         
-        return filtered_results
+        body = web_results_adapter.dump_json(filtered_results)
+        search_results_cache.set(cache_key, body)
+        return Response(content=body, media_type="application/json", headers={"X-Cache": "MISS"})
         
     except Exception as e:
         logger.error(f"Enhanced search failed: {str(e)}")